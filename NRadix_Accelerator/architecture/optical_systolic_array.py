@@ -447,7 +447,8 @@ def optical_ram_weight_interface(n_weight_channels: int = 81) -> Component:
 
 @gf.cell
 def processing_element_streaming(
-    pe_id: Tuple[int, int] = (0, 0)
+    pe_id: Tuple[int, int] = (0, 0),
+    with_label: bool = True
 ) -> Component:
     """
     Streaming Processing Element - NEW SIMPLIFIED ARCHITECTURE (Feb 2026).
@@ -488,6 +489,8 @@ def processing_element_streaming(
 
     Args:
         pe_id: (row, col) identifier
+        with_label: Add the PE[row,col] label. Disable to get a single
+            id-independent cell that can be referenced by every PE in an array.
     """
     c = gf.Component(f"PE_stream_{pe_id[0]}_{pe_id[1]}_{_uid()}")
 
@@ -594,7 +597,8 @@ def processing_element_streaming(
                orientation=270, layer=LAYER_METAL_PAD)
 
     # PE identifier label
-    c.add_label(f"PE[{pe_id[0]},{pe_id[1]}]", position=(total_width/2, total_height - 3), layer=LAYER_TEXT)
+    if with_label:
+        c.add_label(f"PE[{pe_id[0]},{pe_id[1]}]", position=(total_width/2, total_height - 3), layer=LAYER_TEXT)
     c.add_label("STREAM", position=(total_width/2, 3), layer=LAYER_TEXT)
 
     return c
@@ -762,9 +766,15 @@ def systolic_row_streaming(
 
     pe_pitch = PE_WIDTH + PE_SPACING
 
+    # One unlabeled PE master referenced by every column; the PE[row,col]
+    # labels go on the row so the GDS holds a single PE cell, not one per PE.
+    pe_cell = processing_element_streaming(with_label=False)
+
     for col in range(n_cols):
-        pe = c << processing_element_streaming(pe_id=(row_id, col))
+        pe = c << pe_cell
         pe.dmove((col * pe_pitch, 0))
+        c.add_label(f"PE[{row_id},{col}]", position=(col * pe_pitch + PE_WIDTH/2, PE_HEIGHT - 3),
+                    layer=LAYER_TEXT)
 
         # Connect horizontal data flow between PEs
         if col > 0:
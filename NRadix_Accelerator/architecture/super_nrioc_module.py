@@ -68,6 +68,7 @@ from gdsfactory.component import Component
 from gdsfactory.typings import LayerSpec
 import numpy as np
 from typing import Optional, Literal, Tuple, List
+import argparse
 import os
 
 # Activate PDK
@@ -105,6 +106,19 @@ ARRAY_SIZE = 81
 TOTAL_PES = ARRAY_SIZE * ARRAY_SIZE  # 6,561
 TRITS_PER_VALUE = 9
 
+# Output directory for generated GDS files (resolved once at import)
+GDS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'gds')
+
+# Fixed super_ioc_module geometry: rectangles as (x0, y0, x1, y1), built once at import
+_IOC_WIDTH = 2400
+_IOC_HEIGHT = 1800
+_IOC_HOST_WIDTH = 600
+_IOC_HOST_X = _IOC_WIDTH/2 - _IOC_HOST_WIDTH/2
+_IOC_HOST_Y = 30
+_IOC_BG_RECT = (0, 0, _IOC_WIDTH, _IOC_HEIGHT)
+_IOC_DMA_RECTS = tuple((_IOC_HOST_X + k, _IOC_HOST_Y + 30, _IOC_HOST_X + k + 100, _IOC_HOST_Y + 70)
+                       for k in (50, 200, 350))
+
 # Unique ID generator
 _uid_counter = 0
 def _uid() -> str:
@@ -113,6 +127,15 @@ def _uid() -> str:
     return f"{_uid_counter:05d}"
 
 
+def _add_rect(c: Component, x0: float, y0: float, x1: float, y1: float,
+              layer: LayerSpec) -> None:
+    """Insert an axis-aligned rectangle as a native KLayout box.
+
+    Skips the generic point-list -> DPolygon conversion in add_polygon.
+    """
+    c.kdb_cell.shapes(gf.get_layer(layer)).insert(gf.kdb.DBox(x0, y0, x1, y1))
+
+
 # =============================================================================
 # Weight Loader Unit
 # =============================================================================
@@ -1020,12 +1043,11 @@ def super_ioc_module() -> Component:
     c = gf.Component("super_ioc_module")
 
     # Overall dimensions
-    total_width = 2400
-    total_height = 1800
+    total_width = _IOC_WIDTH
+    total_height = _IOC_HEIGHT
 
     # Background
-    c.add_polygon([(0, 0), (total_width, 0), (total_width, total_height), (0, total_height)],
-                  layer=LAYER_BUS)
+    _add_rect(c, *_IOC_BG_RECT, LAYER_BUS)
 
     # ==========================================================================
     # Title Block
@@ -1081,34 +1103,23 @@ def super_ioc_module() -> Component:
     # Host Interface Block (bottom)
     # ==========================================================================
 
-    host_width = 600
+    host_width = _IOC_HOST_WIDTH
     host_height = 150
-    host_x = total_width/2 - host_width/2
-    host_y = 30
+    host_x = _IOC_HOST_X
+    host_y = _IOC_HOST_Y
 
-    c.add_polygon([(host_x, host_y), (host_x + host_width, host_y),
-                   (host_x + host_width, host_y + host_height), (host_x, host_y + host_height)],
-                  layer=LAYER_DMA)
+    _add_rect(c, host_x, host_y, host_x + host_width, host_y + host_height, LAYER_DMA)
 
     c.add_label("HOST INTERFACE", position=(total_width/2, host_y + host_height/2 + 20), layer=LAYER_TEXT)
     c.add_label("PCIe / USB / Ethernet", position=(total_width/2, host_y + host_height/2 - 20), layer=LAYER_TEXT)
 
     # DMA channels
-    c.add_polygon([(host_x + 50, host_y + 30), (host_x + 150, host_y + 30),
-                   (host_x + 150, host_y + 70), (host_x + 50, host_y + 70)], layer=LAYER_METAL_PAD)
-    c.add_label("DMA0", position=(host_x + 100, host_y + 50), layer=LAYER_TEXT)
-
-    c.add_polygon([(host_x + 200, host_y + 30), (host_x + 300, host_y + 30),
-                   (host_x + 300, host_y + 70), (host_x + 200, host_y + 70)], layer=LAYER_METAL_PAD)
-    c.add_label("DMA1", position=(host_x + 250, host_y + 50), layer=LAYER_TEXT)
-
-    c.add_polygon([(host_x + 350, host_y + 30), (host_x + 450, host_y + 30),
-                   (host_x + 450, host_y + 70), (host_x + 350, host_y + 70)], layer=LAYER_METAL_PAD)
-    c.add_label("DMA2", position=(host_x + 400, host_y + 50), layer=LAYER_TEXT)
+    for i, rect in enumerate(_IOC_DMA_RECTS):
+        _add_rect(c, *rect, LAYER_METAL_PAD)
+        c.add_label(f"DMA{i}", position=(rect[0] + 50, host_y + 50), layer=LAYER_TEXT)
 
     # Control registers
-    c.add_polygon([(host_x + 480, host_y + 30), (host_x + 580, host_y + 30),
-                   (host_x + 580, host_y + 120), (host_x + 480, host_y + 120)], layer=LAYER_METAL_PAD)
+    _add_rect(c, host_x + 480, host_y + 30, host_x + 580, host_y + 120, LAYER_METAL_PAD)
     c.add_label("CTRL", position=(host_x + 530, host_y + 90), layer=LAYER_TEXT)
     c.add_label("REGS", position=(host_x + 530, host_y + 60), layer=LAYER_TEXT)
 
@@ -1122,22 +1133,19 @@ def super_ioc_module() -> Component:
     c.add_label("TO ARRAY: WEIGHTS (OPTICAL)", position=(total_width - 100, total_height - 150), layer=LAYER_TEXT)
     for i in range(0, 81, 5):
         y = total_height - 200 - i * 4
-        c.add_polygon([(total_width - 50, y), (total_width, y),
-                       (total_width, y + 2), (total_width - 50, y + 2)], layer=LAYER_WAVEGUIDE)
+        _add_rect(c, total_width - 50, y, total_width, y + 2, LAYER_WAVEGUIDE)
 
     # Activation outputs (81 lines going right)
     c.add_label("TO ARRAY: ACTIVATIONS", position=(total_width - 100, 700), layer=LAYER_TEXT)
     for i in range(0, 81, 5):
         y = 650 - i * 4
-        c.add_polygon([(total_width - 50, y), (total_width, y),
-                       (total_width, y + 2), (total_width - 50, y + 2)], layer=LAYER_WAVEGUIDE)
+        _add_rect(c, total_width - 50, y, total_width, y + 2, LAYER_WAVEGUIDE)
 
     # Result inputs (81 lines coming from right)
     c.add_label("FROM ARRAY: RESULTS", position=(total_width - 100, 350), layer=LAYER_TEXT)
     for i in range(0, 81, 5):
         y = 300 - i * 4
-        c.add_polygon([(total_width - 50, y), (total_width, y),
-                       (total_width, y + 2), (total_width - 50, y + 2)], layer=LAYER_WAVEGUIDE)
+        _add_rect(c, total_width - 50, y, total_width, y + 2, LAYER_WAVEGUIDE)
 
     # ==========================================================================
     # Specifications Block
@@ -1146,8 +1154,7 @@ def super_ioc_module() -> Component:
     spec_x = 50
     spec_y = 50
 
-    c.add_polygon([(spec_x, spec_y), (spec_x + 350, spec_y),
-                   (spec_x + 350, spec_y + 200), (spec_x, spec_y + 200)], layer=LAYER_METAL_PAD)
+    _add_rect(c, spec_x, spec_y, spec_x + 350, spec_y + 200, LAYER_METAL_PAD)
 
     c.add_label("SPECIFICATIONS", position=(spec_x + 175, spec_y + 180), layer=LAYER_TEXT)
     c.add_label("─────────────────", position=(spec_x + 175, spec_y + 165), layer=LAYER_TEXT)
@@ -1232,6 +1239,12 @@ def complete_ai_accelerator() -> Component:
 # =============================================================================
 
 def main():
+    parser = argparse.ArgumentParser(description='Super NR-IOC module GDS generator')
+    parser.add_argument('--choice', choices=['1', '2', '3', '4', '5', '6'],
+                        help='Menu option to generate (skips the interactive prompt)')
+    parser.add_argument('--open', action='store_true', help='Open the result in KLayout')
+    args = parser.parse_args()
+
     print("=" * 70)
     print("  SUPER NR-IOC MODULE GENERATOR")
     print("  Host Interface for Optical Systolic Array")
@@ -1258,57 +1271,62 @@ def main():
     print("  6. Generate complete AI Accelerator (NR-IOC + Array)")
     print()
 
-    choice = input("Select option (1-6): ").strip()
-
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    gds_dir = os.path.join(base_dir, 'data', 'gds')
-    os.makedirs(gds_dir, exist_ok=True)
+    if args.choice:
+        choice = args.choice
+    else:
+        choice = input("Select option (1-6): ").strip()
 
     if choice == "1":
         print("\nGenerating Super NR-IOC module...")
         comp = super_ioc_module()
-        output_path = os.path.join(gds_dir, "super_nrioc_module.gds")
+        output_path = os.path.join(GDS_DIR, "super_nrioc_module.gds")
 
     elif choice == "2":
         print("\nGenerating Weight Streaming unit...")
         comp = weight_loader_unit()
-        output_path = os.path.join(gds_dir, "weight_streaming_unit.gds")
+        output_path = os.path.join(GDS_DIR, "weight_streaming_unit.gds")
 
     elif choice == "3":
         print("\nGenerating Activation Streamer unit...")
         comp = activation_streamer_unit()
-        output_path = os.path.join(gds_dir, "activation_streamer_unit.gds")
+        output_path = os.path.join(GDS_DIR, "activation_streamer_unit.gds")
 
     elif choice == "4":
         print("\nGenerating Result Collector unit...")
         comp = result_collector_unit()
-        output_path = os.path.join(gds_dir, "result_collector_unit.gds")
+        output_path = os.path.join(GDS_DIR, "result_collector_unit.gds")
 
     elif choice == "5":
         print("\nGenerating Clock Distribution hub...")
         comp = clock_distribution_hub()
-        output_path = os.path.join(gds_dir, "clock_distribution_hub.gds")
+        output_path = os.path.join(GDS_DIR, "clock_distribution_hub.gds")
 
     elif choice == "6":
         print("\nGenerating complete AI Accelerator...")
         print("(This may take a while for the 81×81 array)")
         comp = complete_ai_accelerator()
-        output_path = os.path.join(gds_dir, "complete_ai_accelerator.gds")
+        output_path = os.path.join(GDS_DIR, "complete_ai_accelerator.gds")
 
     else:
         print("Invalid selection.")
         return
 
-    comp.write_gds(output_path)
+    os.makedirs(GDS_DIR, exist_ok=True)
+    # Keep the cell hierarchy (PE/row masters + references) and skip the
+    # metadata dump, which for the full accelerator is thousands of entries.
+    comp.write_gds(output_path, with_metadata=False)
     print(f"\nSaved to: {output_path}")
 
     # Get dimensions
     bbox = comp.dbbox()
     print(f"Dimensions: {bbox.width():.0f} × {bbox.height():.0f} μm")
 
-    # Offer to open in KLayout
-    show = input("\nOpen in KLayout? (y/n): ").strip().lower()
-    if show == "y":
+    # Offer to open in KLayout (only prompt in interactive mode)
+    if args.choice:
+        show = args.open
+    else:
+        show = args.open or input("\nOpen in KLayout? (y/n): ").strip().lower() == "y"
+    if show:
         import subprocess
         try:
             subprocess.Popen(["klayout", output_path])
@@ -7,9 +7,22 @@ Adds navigation, dark theme, and clickable links between docs.
 import markdown
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 FOLDER = "/home/jackwayne/Desktop/NRadix_Chip_Package"
 
+# Read markdown sources in 64 KB chunks
+READ_BUFFER_SIZE = 64 * 1024
+
+# Worker threads for overlapping file reads/writes with markdown parsing
+IO_WORKERS = 4
+
+# Single converter shared by all files (reset() between documents)
+_MD = markdown.Markdown(
+    extensions=["tables", "fenced_code", "nl2br", "sane_lists"],
+    output_format="html5",
+)
+
 # Files in reading order with descriptions
 FILES = [
     ("TAPEOUT_READINESS", "Tape-Out Readiness Checklist"),
@@ -214,23 +227,21 @@ def enhance_html(html_content):
     return html_content
 
 
-def convert_file(name, title, idx):
-    """Convert one markdown file to styled HTML."""
+def read_markdown(name):
+    """Read one markdown source, or return None if it does not exist."""
     md_path = os.path.join(FOLDER, f"{name}.md")
 
     if not os.path.exists(md_path):
-        print(f"  SKIP: {md_path} not found")
-        return
+        return None
 
-    with open(md_path, "r") as f:
-        md_content = f.read()
+    with open(md_path, "rb", buffering=READ_BUFFER_SIZE) as f:
+        return f.read().decode("utf-8")
 
+
+def render_html(title, idx, md_content):
+    """Render markdown text to a full styled HTML page (UTF-8 bytes)."""
     # Convert markdown to HTML
-    md_converter = markdown.Markdown(
-        extensions=["tables", "fenced_code", "nl2br", "sane_lists"],
-        output_format="html5",
-    )
-    body_html = md_converter.convert(md_content)
+    body_html = _MD.reset().convert(md_content)
     body_html = enhance_html(body_html)
 
     nav = build_nav(idx)
@@ -255,18 +266,51 @@ def convert_file(name, title, idx):
 </body>
 </html>"""
 
+    # Encode once and write raw bytes (no text-mode newline translation)
+    return full_html.encode("utf-8")
+
+
+def write_html(name, data):
+    """Write rendered HTML bytes next to the markdown source."""
     html_path = os.path.join(FOLDER, f"{name}.html")
-    with open(html_path, "w") as f:
-        f.write(full_html)
+    with open(html_path, "wb") as f:
+        f.write(data)
+
+
+def convert_file(name, title, idx):
+    """Convert one markdown file to styled HTML."""
+    md_content = read_markdown(name)
+    if md_content is None:
+        print(f"  SKIP: {os.path.join(FOLDER, f'{name}.md')} not found")
+        return
 
+    write_html(name, render_html(title, idx, md_content))
     print(f"  OK: {name}.html")
 
 
 def main():
     print(f"Converting {len(FILES)} docs to HTML...\n")
 
-    for idx, (name, title) in enumerate(FILES):
-        convert_file(name, title, idx)
+    # Reads and writes run on worker threads so file I/O overlaps with
+    # parsing; parsing stays on this thread (the shared converter is not
+    # thread-safe) and results are reported in reading order.
+    with ThreadPoolExecutor(max_workers=IO_WORKERS) as pool:
+        reads = [pool.submit(read_markdown, name) for name, _ in FILES]
+        writes = []
+        for idx, ((name, title), read) in enumerate(zip(FILES, reads)):
+            md_content = read.result()
+            if md_content is None:
+                writes.append((name, None))
+                continue
+            data = render_html(title, idx, md_content)
+            writes.append((name, pool.submit(write_html, name, data)))
+
+        for name, write in writes:
+            if write is None:
+                print(f"  SKIP: {os.path.join(FOLDER, f'{name}.md')} not found")
+                continue
+            write.result()
+            print(f"  OK: {name}.html")
 
     print(f"\nDone! All HTML files in: {FOLDER}")
     print("Open START_HERE.html to begin.")
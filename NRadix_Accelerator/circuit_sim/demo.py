@@ -18,6 +18,9 @@ import tkinter as tk
 from tkinter import font as tkfont
 import sys
 import os
+from array import array
+from functools import partial
+import numpy as np
 
 # Add parent to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -28,16 +31,17 @@ from simulate_9x9 import simulate_array_9x9
 # Color scheme — matches real wavelengths
 # =============================================================================
 
-COLORS = {
-    +1: "#3B82F6",   # Blue  (1064 nm)
-    0:  "#22C55E",   # Green (1310 nm)
-    -1: "#EF4444",   # Red   (1550 nm)
-}
-COLORS_LIGHT = {
-    +1: "#BFDBFE",
-    0:  "#BBF7D0",
-    -1: "#FECACA",
-}
+# Per-trit lookups are flat tuples indexed by trit + 1 (-1 → 0, 0 → 1, +1 → 2)
+COLORS = (
+    "#EF4444",   # -1  Red   (1550 nm)
+    "#22C55E",   #  0  Green (1310 nm)
+    "#3B82F6",   # +1  Blue  (1064 nm)
+)
+COLORS_LIGHT = (
+    "#FECACA",
+    "#BBF7D0",
+    "#BFDBFE",
+)
 COLOR_EMPTY = "#E5E7EB"
 COLOR_BG = "#1E293B"
 COLOR_PANEL = "#334155"
@@ -46,64 +50,69 @@ COLOR_DIM = "#94A3B8"
 COLOR_GOLD = "#F59E0B"
 COLOR_PASS = "#22C55E"
 
-TRIT_LABEL = {+1: "+1", 0: " 0", -1: "-1"}
-TRIT_SYMBOL = {+1: "+", 0: "0", -1: "-"}
+TRIT_LABEL = ("-1", " 0", "+1")
+TRIT_SYMBOL = ("-", "0", "+")
+
+# (text, bg, fg) of a blank cell
+_EMPTY_STATE = ("", COLOR_EMPTY, "white")
+
+# (text, bg, fg) of a PE cell showing the product trit, indexed by product + 1
+_PE_DISPLAY = tuple((TRIT_LABEL[p + 1], COLORS[p + 1], "white") for p in (-1, 0, 1))
+
+
+def _is_trit(val):
+    """True if val is a single trit in {-1, 0, +1}."""
+    return isinstance(val, int) and -1 <= val <= 1
+
+
+def _trit_rows(matrix):
+    """Freeze an int8 matrix as a tuple of array('b') rows (1 byte per trit)."""
+    return tuple(array('b', row.tobytes()) for row in matrix)
 
 
 # =============================================================================
 # The 5 examples
 # =============================================================================
 
+# Inputs are array('b') and weight matrices are tuples of array('b') rows
+# (built from NumPy int8 via _trit_rows); simulate_array_9x9 reads them as
+# plain sequences.
 EXAMPLES = [
     {
         "name": "Add Four Ones = 4",
         "desc": "Four +1 inputs, all weights +1 in column 0.\nThe column sums: 1+1+1+1 = 4.",
-        "input": [+1, +1, +1, +1, 0, 0, 0, 0, 0],
-        "weights": [
-            [+1, 0, 0, 0, 0, 0, 0, 0, 0],
-            [+1, 0, 0, 0, 0, 0, 0, 0, 0],
-            [+1, 0, 0, 0, 0, 0, 0, 0, 0],
-            [+1, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0,  0, 0, 0, 0, 0, 0, 0, 0],
-            [0,  0, 0, 0, 0, 0, 0, 0, 0],
-            [0,  0, 0, 0, 0, 0, 0, 0, 0],
-            [0,  0, 0, 0, 0, 0, 0, 0, 0],
-            [0,  0, 0, 0, 0, 0, 0, 0, 0],
-        ],
+        "input": array('b', [+1, +1, +1, +1, 0, 0, 0, 0, 0]),
+        # +1 in rows 0-3 of column 0, zero elsewhere
+        "weights": _trit_rows(np.pad(np.ones((4, 1), dtype=np.int8), ((0, 5), (0, 8)))),
     },
     {
         "name": "Identity: Output = Input",
         "desc": "Weight matrix = identity.\nWhat goes in, comes out.",
-        "input": [+1, -1, 0, +1, -1, +1, 0, -1, +1],
-        "weights": [[1 if i == j else 0 for j in range(9)] for i in range(9)],
+        "input": array('b', [+1, -1, 0, +1, -1, +1, 0, -1, +1]),
+        "weights": _trit_rows(np.eye(9, dtype=np.int8)),
     },
     {
         "name": "Negate Everything",
         "desc": "Weight = negative identity.\nEvery value flips sign: +1 becomes -1.",
-        "input": [+1, +1, -1, 0, +1, -1, -1, +1, 0],
-        "weights": [[-1 if i == j else 0 for j in range(9)] for i in range(9)],
+        "input": array('b', [+1, +1, -1, 0, +1, -1, -1, +1, 0]),
+        "weights": _trit_rows(-np.eye(9, dtype=np.int8)),
     },
     {
         "name": "All Ones: 1+1+...+1 = 9",
         "desc": "Every input +1, every weight +1.\nEach column sums nine +1s = 9.",
-        "input": [+1] * 9,
-        "weights": [[+1] * 9 for _ in range(9)],
+        "input": array('b', [+1] * 9),
+        "weights": _trit_rows(np.ones((9, 9), dtype=np.int8)),
     },
     {
         "name": "Mixed Multiply-Accumulate",
         "desc": "Mixed +1/-1 inputs, interesting weight pattern.\nShows the chip doing real math with negatives.",
-        "input": [+1, -1, +1, -1, +1, -1, +1, -1, +1],
-        "weights": [
-            [+1, -1,  0,  0,  0,  0,  0,  0,  0],
-            [-1, +1, -1,  0,  0,  0,  0,  0,  0],
-            [ 0, -1, +1, -1,  0,  0,  0,  0,  0],
-            [ 0,  0, -1, +1, -1,  0,  0,  0,  0],
-            [ 0,  0,  0, -1, +1, -1,  0,  0,  0],
-            [ 0,  0,  0,  0, -1, +1, -1,  0,  0],
-            [ 0,  0,  0,  0,  0, -1, +1, -1,  0],
-            [ 0,  0,  0,  0,  0,  0, -1, +1, -1],
-            [ 0,  0,  0,  0,  0,  0,  0, -1, +1],
-        ],
+        "input": array('b', [+1, -1, +1, -1, +1, -1, +1, -1, +1]),
+        # Tridiagonal: +1 on the diagonal, -1 on both off-diagonals
+        "weights": _trit_rows(
+            np.eye(9, dtype=np.int8)
+            - np.eye(9, k=1, dtype=np.int8)
+            - np.eye(9, k=-1, dtype=np.int8)
+        ),
     },
 ]
 
@@ -133,12 +142,20 @@ class ChipDemo(tk.Tk):
         self.pe_cells = [[None]*9 for _ in range(9)]
         self.input_cells = [None]*9
         self.output_cells = [None]*9
-        self.product_cells = [[None]*9 for _ in range(9)]
-        self.weight_labels = [[None]*9 for _ in range(9)]
-        self.animation_step = 0
+        self._cell_state = {}            # (rect_id, text_id) -> (text, bg, fg)
         self.current_example = None
         self.current_result = None
 
+        # Animation pacing. step_delay[i] is the wait (ms) after step i; a
+        # frame runs consecutive steps until their delays fill one frame
+        # interval, so short delays are batched into a single redraw.
+        self.target_fps = 120
+        self.frame_interval_ms = 1000 // self.target_fps
+        self.step_delay = [400] + [200] * 9 + [400, 0]
+        self._anim_job = None
+        self._anim_gen = None
+        self._product_cols = None
+
         self._build_ui()
 
     def _build_ui(self):
@@ -177,7 +194,7 @@ class ChipDemo(tk.Tk):
                 font=self.font_btn, bg="#475569", fg=COLOR_TEXT,
                 activebackground=COLOR_GOLD, activeforeground=COLOR_BG,
                 relief="flat", cursor="hand2", anchor="w",
-                command=lambda idx=i: self.run_example(idx),
+                command=partial(self.run_example, i),
             )
             btn.pack(fill="x", pady=3)
             self.buttons.append(btn)
@@ -200,7 +217,7 @@ class ChipDemo(tk.Tk):
                                 (-1, "-1  Red", "1550nm")]:
             row = tk.Frame(legend, bg=COLOR_PANEL)
             row.pack(anchor="w", pady=1)
-            tk.Canvas(row, width=14, height=14, bg=COLORS[val],
+            tk.Canvas(row, width=14, height=14, bg=COLORS[val + 1],
                       highlightthickness=0).pack(side="left", padx=(0, 5))
             tk.Label(row, text=f"{label} ({wl})", font=self.font_small,
                      fg=COLOR_TEXT, bg=COLOR_PANEL).pack(side="left")
@@ -212,138 +229,147 @@ class ChipDemo(tk.Tk):
         self._build_grid(right)
 
     def _build_grid(self, parent):
-        grid_frame = tk.Frame(parent, bg=COLOR_BG)
-        grid_frame.pack(pady=5)
-
+        # The whole chip grid is drawn on one Canvas; each cell is a
+        # (rect_id, text_id) pair updated with itemconfigure.
         cell_size = 44
         gap = 2
+        pitch = cell_size + gap
+        grid_x = cell_size + 30          # PE columns start after input cell + arrow
+        grid_y = 56                      # below the header / weight label rows
+        out_y = grid_y + 9 * pitch + 36  # output row below the arrows + label
+
+        grid_width = grid_x + 9 * pitch
+        canvas = tk.Canvas(
+            parent, width=grid_width, height=out_y + pitch,
+            bg=COLOR_BG, highlightthickness=0,
+        )
+        canvas.pack(pady=5)
+        self.grid_canvas = canvas
+
+        def make_cell(x, y):
+            rect = canvas.create_rectangle(
+                x, y, x + cell_size, y + cell_size, fill=COLOR_EMPTY, outline="",
+            )
+            text = canvas.create_text(
+                x + cell_size / 2, y + cell_size / 2, text="",
+                font=self.font_cell, fill="white",
+            )
+            # Items start blank, so record that for the state cache
+            self._cell_state[(rect, text)] = _EMPTY_STATE
+            return (rect, text)
 
-        # Column headers: "w0 w1 w2..."
-        header_row = tk.Frame(grid_frame, bg=COLOR_BG)
-        header_row.pack()
-        tk.Label(header_row, text="", width=6, bg=COLOR_BG).pack(side="left")  # spacer for row labels
-        tk.Label(header_row, text="weights (from top)", font=self.font_small,
-                 fg=COLOR_DIM, bg=COLOR_BG).pack(side="left")
-
-        # Weight labels row
-        wlabel_row = tk.Frame(grid_frame, bg=COLOR_BG)
-        wlabel_row.pack()
-        tk.Label(wlabel_row, text="", width=6, bg=COLOR_BG).pack(side="left")
+        # Column headers: "weights (from top)" and "w0 w1 w2..."
+        canvas.create_text(grid_x, 8, text="weights (from top)", anchor="w",
+                           font=self.font_small, fill=COLOR_DIM)
         for col in range(9):
-            lbl = tk.Label(wlabel_row, text=f"w{col}", width=4,
-                           font=self.font_small, fg=COLOR_DIM, bg=COLOR_BG)
-            lbl.pack(side="left", padx=gap)
+            canvas.create_text(grid_x + col * pitch + cell_size / 2, 26, text=f"w{col}",
+                               font=self.font_small, fill=COLOR_DIM)
 
         # Input label
-        inp_label = tk.Frame(grid_frame, bg=COLOR_BG)
-        inp_label.pack(anchor="w")
-        tk.Label(inp_label, text=" input", font=self.font_small,
-                 fg=COLOR_DIM, bg=COLOR_BG).pack(side="left")
+        canvas.create_text(0, 44, text=" input", anchor="w",
+                           font=self.font_small, fill=COLOR_DIM)
 
         # Main grid rows
         for row in range(9):
-            row_frame = tk.Frame(grid_frame, bg=COLOR_BG)
-            row_frame.pack()
-
-            # Input cell (left edge)
-            inp_cell = tk.Label(
-                row_frame, text="", width=3, height=1,
-                font=self.font_cell, bg=COLOR_EMPTY, fg="white",
-                relief="flat", padx=2, pady=2,
-            )
-            inp_cell.pack(side="left", padx=(0, 6))
-            self.input_cells[row] = inp_cell
+            y = grid_y + row * pitch
 
-            # Arrow
-            tk.Label(row_frame, text="\u2192", fg=COLOR_DIM, bg=COLOR_BG,
-                     font=self.font_small).pack(side="left", padx=(0, 4))
+            # Input cell (left edge) and arrow
+            self.input_cells[row] = make_cell(0, y)
+            canvas.create_text(cell_size + 15, y + cell_size / 2, text="\u2192",
+                               font=self.font_small, fill=COLOR_DIM)
 
             # PE cells
             for col in range(9):
-                cell = tk.Label(
-                    row_frame, text="", width=3, height=1,
-                    font=self.font_cell, bg=COLOR_EMPTY, fg="white",
-                    relief="flat", padx=2, pady=2,
-                )
-                cell.pack(side="left", padx=gap, pady=gap)
-                self.pe_cells[row][col] = cell
+                self.pe_cells[row][col] = make_cell(grid_x + col * pitch, y)
 
         # Arrow row between grid and output
-        arrow_row = tk.Frame(grid_frame, bg=COLOR_BG)
-        arrow_row.pack()
-        tk.Label(arrow_row, text="", width=6, bg=COLOR_BG).pack(side="left")
+        arrow_y = grid_y + 9 * pitch + 6
         for col in range(9):
-            tk.Label(arrow_row, text="\u2193", width=4,
-                     font=self.font_small, fg=COLOR_DIM, bg=COLOR_BG
-                     ).pack(side="left", padx=gap)
+            canvas.create_text(grid_x + col * pitch + cell_size / 2, arrow_y, text="\u2193",
+                               font=self.font_small, fill=COLOR_DIM)
 
         # Output label
-        tk.Label(grid_frame, text="  output (column sums)", font=self.font_small,
-                 fg=COLOR_DIM, bg=COLOR_BG).pack(anchor="w")
+        canvas.create_text(0, arrow_y + 16, text="  output (column sums)", anchor="w",
+                           font=self.font_small, fill=COLOR_DIM)
 
         # Output cells
-        out_row = tk.Frame(grid_frame, bg=COLOR_BG)
-        out_row.pack()
-        tk.Label(out_row, text="", width=6, bg=COLOR_BG).pack(side="left")
         for col in range(9):
-            cell = tk.Label(
-                out_row, text="", width=3, height=1,
-                font=self.font_cell, bg=COLOR_EMPTY, fg="white",
-                relief="flat", padx=2, pady=2,
-            )
-            cell.pack(side="left", padx=gap, pady=gap)
-            self.output_cells[col] = cell
+            self.output_cells[col] = make_cell(grid_x + col * pitch, out_y)
 
-        # Result text
-        self.result_frame = tk.Frame(parent, bg=COLOR_BG)
+        # Result text: fixed-size frame with placed labels, so changing the
+        # result/status text never triggers a layout pass for the window.
+        # The status wraps at the grid width and the frame leaves room for
+        # two status lines (a failing "Expected ... -- got ..." is long).
+        self.result_frame = tk.Frame(parent, bg=COLOR_BG, width=grid_width, height=68)
         self.result_frame.pack(pady=(10, 5))
+        self.result_frame.pack_propagate(False)
 
         self.result_label = tk.Label(
             self.result_frame, text="", font=self.font_result,
             fg=COLOR_TEXT, bg=COLOR_BG,
         )
-        self.result_label.pack()
+        self.result_label.place(relx=0.5, y=0, anchor="n")
 
         self.status_label = tk.Label(
             self.result_frame, text="", font=self.font_label,
-            fg=COLOR_DIM, bg=COLOR_BG,
+            fg=COLOR_DIM, bg=COLOR_BG, wraplength=grid_width,
         )
-        self.status_label.pack()
+        self.status_label.place(relx=0.5, y=30, anchor="n")
 
     def _color_for_value(self, val):
         """Get color for a trit value."""
-        if val in COLORS:
-            return COLORS[val]
+        if _is_trit(val):
+            return COLORS[val + 1]
         # For accumulated values outside {-1,0,+1}, use gold
         return COLOR_GOLD
 
     def _set_cell(self, cell, val, is_product=False):
-        """Set a cell's display value and color."""
-        if val is None:
-            cell.configure(text="", bg=COLOR_EMPTY, fg="white")
-            return
+        """Set a cell's display value and color.
 
-        if isinstance(val, int) and val in COLORS and not is_product:
-            cell.configure(
-                text=TRIT_LABEL.get(val, str(val)),
-                bg=COLORS[val], fg="white",
-            )
+        The last (text, bg, fg) is cached per cell, so redrawing an
+        unchanged value skips the canvas itemconfigure calls.
+        """
+        if val is None:
+            state = _EMPTY_STATE
+        elif _is_trit(val) and not is_product:
+            state = (TRIT_LABEL[val + 1], COLORS[val + 1], "white")
         else:
             # Accumulated value or product display
-            bg = self._color_for_value(val) if isinstance(val, int) and val in COLORS else COLOR_GOLD
-            cell.configure(
-                text=str(val) if isinstance(val, int) else val,
-                bg=bg, fg=COLOR_BG if bg == COLOR_GOLD else "white",
-            )
+            bg = self._color_for_value(val) if _is_trit(val) else COLOR_GOLD
+            state = (str(val) if isinstance(val, int) else val,
+                     bg, COLOR_BG if bg == COLOR_GOLD else "white")
+
+        self._apply_state(cell, state)
+
+    def _apply_state(self, cell, state):
+        """Draw a precomputed (text, bg, fg) state into a cell."""
+        if self._cell_state.get(cell) == state:
+            return
+        text, bg, fg = state
+        rect_id, text_id = cell
+        self.grid_canvas.itemconfigure(rect_id, fill=bg)
+        self.grid_canvas.itemconfigure(text_id, text=text, fill=fg)
+        self._cell_state[cell] = state
+
+    def _apply_states(self, cells, states):
+        """Draw several cells with one Tcl eval instead of a call per item."""
+        canvas = str(self.grid_canvas)
+        script = []
+        for cell, state in zip(cells, states):
+            if self._cell_state.get(cell) == state:
+                continue
+            text, bg, fg = state
+            rect_id, text_id = cell
+            script.append(f"{canvas} itemconfigure {rect_id} -fill {bg}")
+            script.append(f"{canvas} itemconfigure {text_id} -text {{{text}}} -fill {fg}")
+            self._cell_state[cell] = state
+        if script:
+            self.tk.eval("\n".join(script))
 
     def clear_grid(self):
-        """Reset all cells to empty."""
-        for row in range(9):
-            self._set_cell(self.input_cells[row], None)
-            for col in range(9):
-                self._set_cell(self.pe_cells[row][col], None)
-        for col in range(9):
-            self._set_cell(self.output_cells[col], None)
+        """Reset all cells to empty (cells that are already empty are skipped)."""
+        cells = [cell for cell, state in self._cell_state.items() if state != _EMPTY_STATE]
+        self._apply_states(cells, [_EMPTY_STATE] * len(cells))
         self.result_label.configure(text="")
         self.status_label.configure(text="")
 
@@ -352,7 +378,23 @@ class ChipDemo(tk.Tk):
         ex = EXAMPLES[idx]
         self.current_example = ex
 
-        # Highlight active button
+        # Run the actual physics simulation
+        self.current_result = simulate_array_9x9(
+            ex["input"], ex["weights"], verbose=False
+        )
+
+        # All 81 activation × weight products in one multiply, stored per
+        # column for the propagation steps
+        products = np.asarray(ex["input"])[:, None] * np.asarray(ex["weights"])
+        self._product_cols = products.T.tolist()
+
+        # Animate: clear, then fill step by step
+        if self._anim_job is not None:
+            self.after_cancel(self._anim_job)
+        self.clear_grid()
+
+        # Highlight active button (flushed together with the cleared grid
+        # by the first animation frame)
         for i, btn in enumerate(self.buttons):
             if i == idx:
                 btn.configure(bg=COLOR_GOLD, fg=COLOR_BG)
@@ -361,82 +403,76 @@ class ChipDemo(tk.Tk):
 
         self.desc_label.configure(text=ex["desc"])
 
-        # Run the actual physics simulation
-        self.current_result = simulate_array_9x9(
-            ex["input"], ex["weights"], verbose=False
-        )
+        self._anim_gen = self._animation_gen(ex)
+        self._pump()
+
+    def _pump(self):
+        """Advance the animation until one frame interval of step delay has
+        accumulated, then schedule the next frame."""
+        self._anim_job = None
+        accumulated = 0
+        delay = 0
+        while accumulated < self.frame_interval_ms:
+            delay = next(self._anim_gen, None)
+            if delay is None:
+                break
+            accumulated += delay
+
+        # Flush this frame's redraws once (never a full update())
+        self.update_idletasks()
+
+        if delay is not None:
+            self._anim_job = self.after(accumulated, self._pump)
+
+    def _animation_gen(self, ex):
+        """Animate the chip computation, yielding the delay (ms) after each step."""
+        # Step 0: Show inputs lighting up
+        self.status_label.configure(text="Encoding inputs...", fg=COLOR_DIM)
+        for row in range(9):
+            self._set_cell(self.input_cells[row], ex["input"][row])
+        yield self.step_delay[0]
 
-        # Animate: clear, then fill step by step
-        self.clear_grid()
-        self.animation_step = 0
-        self._animate_step(ex)
-
-    def _animate_step(self, ex):
-        """Animate the chip computation step by step."""
-        step = self.animation_step
-
-        if step == 0:
-            # Step 0: Show inputs lighting up
-            self.status_label.configure(text="Encoding inputs...", fg=COLOR_DIM)
-            for row in range(9):
-                self._set_cell(self.input_cells[row], ex["input"][row])
-            self.animation_step = 1
-            self.after(400, lambda: self._animate_step(ex))
-
-        elif 1 <= step <= 9:
-            # Steps 1-9: Light propagates through each column (left to right)
-            col = step - 1
+        # Steps 1-9: Light propagates through each column (left to right)
+        for col in range(9):
             self.status_label.configure(
                 text=f"Light propagating... column {col}", fg=COLOR_DIM
             )
-            for row in range(9):
-                trit_a = ex["input"][row]
-                trit_w = ex["weights"][row][col]
-                product = trit_a * trit_w
-
-                # Show the product in the PE cell
-                if trit_a == 0 or trit_w == 0:
-                    self._set_cell(self.pe_cells[row][col], 0)
-                else:
-                    self._set_cell(self.pe_cells[row][col], product)
-
-            self.animation_step = step + 1
-            self.after(200, lambda: self._animate_step(ex))
-
-        elif step == 10:
-            # Step 10: Show column sums (outputs)
-            self.status_label.configure(text="Reading detectors...", fg=COLOR_DIM)
-            result = self.current_result
-            for col in range(9):
-                val = result.detected_output[col]
-                self._set_cell(self.output_cells[col], val, is_product=True)
-
-            self.animation_step = 11
-            self.after(400, lambda: self._animate_step(ex))
-
-        elif step == 11:
-            # Step 11: Show final result
-            result = self.current_result
-            out = result.detected_output
-            expected = result.expected_output
-            match = result.all_correct
-
-            self.result_label.configure(
-                text=f"Output: {out}",
-                fg=COLOR_PASS if match else "#EF4444",
+            # Show the products in this column's PE cells (one Tcl call)
+            self._apply_states(
+                [self.pe_cells[row][col] for row in range(9)],
+                [_PE_DISPLAY[p + 1] for p in self._product_cols[col]],
             )
+            yield self.step_delay[1 + col]
 
-            if match:
-                self.status_label.configure(
-                    text="PASS -- Detected output matches expected",
-                    fg=COLOR_PASS,
-                )
-            else:
-                self.status_label.configure(
-                    text=f"Expected {expected} -- got {out}",
-                    fg="#EF4444",
-                )
+        # Step 10: Show column sums (outputs)
+        self.status_label.configure(text="Reading detectors...", fg=COLOR_DIM)
+        result = self.current_result
+        for col in range(9):
+            val = result.detected_output[col]
+            self._set_cell(self.output_cells[col], val, is_product=True)
+        yield self.step_delay[10]
+
+        # Step 11: Show final result
+        out = result.detected_output
+        expected = result.expected_output
+        match = result.all_correct
+
+        self.result_label.configure(
+            text=f"Output: {out}",
+            fg=COLOR_PASS if match else "#EF4444",
+        )
 
+        if match:
+            self.status_label.configure(
+                text="PASS -- Detected output matches expected",
+                fg=COLOR_PASS,
+            )
+        else:
+            self.status_label.configure(
+                text=f"Expected {expected} -- got {out}",
+                fg="#EF4444",
+            )
+        yield self.step_delay[11]
 
 def main():
     app = ChipDemo()
@@ -10,6 +10,8 @@ Wavelengths: 1064, 1310, 1550 nm (input) → 532-775 nm (SFG output)
 Extended to support all 6 WDM triplets (1000-1340 nm input, 500-670 nm SFG).
 """
 
+import functools
+import math
 import numpy as np
 from dataclasses import dataclass
 
@@ -22,7 +24,12 @@ N_LINBO3 = 2.2                    # Bulk refractive index
 C_UM_PS = 299.792                 # Speed of light (μm/ps)
 V_GROUP = C_UM_PS / N_LINBO3      # Group velocity in LiNbO3
 
+# dB -> linear: 10**(x/10) == exp(x * ln(10)/10)
+_LN10_OVER_10 = math.log(10) / 10
+_TWO_PI = 2 * math.pi
 
+
+@functools.lru_cache(maxsize=512)
 def neff_sellmeier(wavelength_nm: float) -> float:
     """
     Compute effective index for TFLN ridge waveguide using a Cauchy model
@@ -58,17 +65,18 @@ _WDM_TRIPLETS = {
     5: (1280, 1260, 1240),
     6: (1340, 1320, 1300),
 }
+# Collect {nm key: wavelength to evaluate} first (first occurrence wins),
+# then fill NEFF in a single update
+_neff_fill = {}
 for _tid, (_wm1, _w0, _wp1) in _WDM_TRIPLETS.items():
     for _wl in [_wm1, _w0, _wp1]:
-        if _wl not in NEFF:
-            NEFF[_wl] = neff_sellmeier(_wl)
+        _neff_fill.setdefault(_wl, _wl)
     # Also populate SFG product wavelengths
     for _wa in [_wm1, _w0, _wp1]:
         for _wb in [_wm1, _w0, _wp1]:
             _sfg_wl = round(1.0 / (1.0 / _wa + 1.0 / _wb), 1)
-            _sfg_wl_int = round(_sfg_wl)
-            if _sfg_wl_int not in NEFF:
-                NEFF[_sfg_wl_int] = neff_sellmeier(_sfg_wl)
+            _neff_fill.setdefault(round(_sfg_wl), _sfg_wl)
+NEFF.update({_k: neff_sellmeier(_wl) for _k, _wl in _neff_fill.items() if _k not in NEFF})
 
 # Ternary encoding
 TRIT_TO_WL = {-1: 1550, 0: 1310, +1: 1064}  # nm
@@ -94,16 +102,16 @@ SFG_RESULT = {
 }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OpticalSignal:
-    """Represents an optical signal at a specific wavelength."""
+    """Represents an optical signal at a specific wavelength (immutable)."""
     wavelength_nm: float    # Wavelength in nm
     power_dbm: float        # Power in dBm
     phase_rad: float = 0.0  # Phase (radians)
 
     @property
     def power_mw(self) -> float:
-        return 10 ** (self.power_dbm / 10)
+        return math.exp(self.power_dbm * _LN10_OVER_10)
 
     def attenuate(self, loss_db: float) -> 'OpticalSignal':
         return OpticalSignal(
@@ -120,6 +128,43 @@ class OpticalSignal:
         )
 
 
+@dataclass(slots=True)
+class SignalBatch:
+    """
+    Many optical signals as parallel arrays (structure of arrays).
+
+    Element i of each array describes one signal; the arrays may have any
+    shape as long as all three match, so e.g. a (9, 9, T) batch indexes
+    as batch[row, col] -> T signals.
+    """
+    wavelength_nm: np.ndarray
+    power_dbm: np.ndarray
+    phase_rad: np.ndarray
+
+    @classmethod
+    def concat(cls, batches: list['SignalBatch'], axis: int = 0) -> 'SignalBatch':
+        return cls(
+            np.concatenate([b.wavelength_nm for b in batches], axis=axis),
+            np.concatenate([b.power_dbm for b in batches], axis=axis),
+            np.concatenate([b.phase_rad for b in batches], axis=axis),
+        )
+
+    def __len__(self) -> int:
+        return len(self.wavelength_nm)
+
+    def __getitem__(self, key) -> 'SignalBatch':
+        return SignalBatch(
+            self.wavelength_nm[key], self.power_dbm[key], self.phase_rad[key],
+        )
+
+    @property
+    def power_mw(self) -> np.ndarray:
+        return np.exp(self.power_dbm * _LN10_OVER_10)
+
+    def attenuate(self, loss_db: float) -> 'SignalBatch':
+        return SignalBatch(self.wavelength_nm, self.power_dbm - loss_db, self.phase_rad)
+
+
 # =============================================================================
 # Component: Waveguide
 # =============================================================================
@@ -141,21 +186,65 @@ def waveguide_transfer(
         Output optical signal with accumulated loss and phase
     """
     wl = signal.wavelength_nm
-    neff = NEFF.get(round(wl), neff_sellmeier(wl))
+    neff = NEFF.get(round(wl))
+    if neff is None:
+        neff = neff_sellmeier(wl)
 
     # Loss
     loss_db = loss_db_per_cm * length_um / 1e4
 
     # Phase
-    phase = 2 * np.pi * neff * length_um / (wl / 1000)  # wl in μm
+    phase = _TWO_PI * neff * length_um / (wl / 1000)  # wl in μm
 
     return OpticalSignal(wl, signal.power_dbm - loss_db, signal.phase_rad + phase)
 
 
+def waveguide_transfer_batch(
+    signals: SignalBatch,
+    length_um: float | np.ndarray,
+    loss_db_per_cm: float = 2.0,
+) -> SignalBatch:
+    """
+    Vectorized waveguide_transfer over every signal in a SignalBatch.
+
+    length_um may be an array that broadcasts against the batch shape
+    (e.g. one path length per row).
+    """
+    wl = signals.wavelength_nm
+    # Batches hold only a handful of distinct wavelengths (triplet inputs or
+    # their SFG products), so look neff up once per distinct value
+    wl_unique, wl_inverse = np.unique(wl, return_inverse=True)
+    neff_unique = np.array(
+        [NEFF.get(round(w)) or neff_sellmeier(w) for w in wl_unique.tolist()], dtype=float,
+    )
+    neff = neff_unique[wl_inverse].reshape(wl.shape)
+
+    loss_db = loss_db_per_cm * length_um / 1e4
+    phase = _TWO_PI * neff * length_um / (wl / 1000)  # wl in μm
+
+    return SignalBatch(wl, signals.power_dbm - loss_db, signals.phase_rad + phase)
+
+
 # =============================================================================
 # Component: SFG Mixer (PPLN)
 # =============================================================================
 
+# Floor of the SFG output power (1e-10 mW)
+_SFG_FLOOR_DBM = -100.0
+
+
+def _sfg_fractions_db(conversion_efficiency: float) -> tuple[float, float]:
+    """
+    Converted and passthrough power fractions of an SFG mixer, in dB.
+
+    An empty fraction (efficiency 0 or 1) is -inf dB, so the SFG output
+    falls to the floor and the passthrough goes dark.
+    """
+    sfg_db = 10 * math.log10(conversion_efficiency) if conversion_efficiency > 0.0 else -math.inf
+    pass_db = 10 * math.log10(1.0 - conversion_efficiency) if conversion_efficiency < 1.0 else -math.inf
+    return sfg_db, pass_db
+
+
 def sfg_mixer(
     signal_a: OpticalSignal,
     signal_b: OpticalSignal,
@@ -196,23 +285,25 @@ def sfg_mixer(
     # SFG power: proportional to product of input powers × efficiency
     # In a linearized model: P_sfg = eta * sqrt(P_a * P_b)
     # For circuit sim, we use a simpler model calibrated from FDTD
-    p_a_mw = signal_a.power_mw
-    p_b_mw = signal_b.power_mw
 
-    # SFG output power (simplified: fraction of geometric mean of inputs)
-    p_sfg_mw = conversion_efficiency * np.sqrt(p_a_mw * p_b_mw)
-    p_sfg_dbm = 10 * np.log10(max(p_sfg_mw, 1e-10))
+    # SFG output power (simplified: fraction of geometric mean of inputs),
+    # evaluated in dB: the geometric mean of two powers is the mean of
+    # their dBm values (floored at 1e-10 mW = -100 dBm)
+    sfg_fraction_db, pass_fraction_db = _sfg_fractions_db(conversion_efficiency)
+    p_sfg_dbm = max(
+        sfg_fraction_db + 0.5 * (signal_a.power_dbm + signal_b.power_dbm),
+        _SFG_FLOOR_DBM,
+    )
 
-    # Passthrough: what doesn't get converted
-    pass_fraction = 1.0 - conversion_efficiency
+    # Passthrough: what doesn't get converted (pass_fraction_db above)
     pass_a = OpticalSignal(
         wl_a,
-        signal_a.power_dbm + 10 * np.log10(pass_fraction) - insertion_loss_db,
+        signal_a.power_dbm + pass_fraction_db - insertion_loss_db,
         signal_a.phase_rad,
     )
     pass_b = OpticalSignal(
         wl_b,
-        signal_b.power_dbm + 10 * np.log10(pass_fraction) - insertion_loss_db,
+        signal_b.power_dbm + pass_fraction_db - insertion_loss_db,
         signal_b.phase_rad,
     )
 
@@ -221,6 +312,54 @@ def sfg_mixer(
     return sfg_out, pass_a, pass_b
 
 
+def sfg_mixer_batch(
+    wl_a: np.ndarray,
+    power_a_dbm: np.ndarray,
+    wl_b: np.ndarray,
+    power_b_dbm: np.ndarray,
+    ppln_length_um: float = 26.0,
+    conversion_efficiency: float = 0.10,
+    insertion_loss_db: float = 1.0,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized sfg_mixer over aligned arrays of signal pairs.
+
+    Signals are passed as parallel wavelength / power arrays (structure of
+    arrays) instead of OpticalSignal objects; phases are unchanged by the
+    mixer (SFG output phase is 0), so they are not needed here.
+
+    Returns:
+        (sfg_wl_nm, sfg_power_dbm, pass_a_dbm, pass_b_dbm)
+        sfg_wl_nm and sfg_power_dbm are NaN where sfg_mixer returns None
+    """
+    MIN_POWER_DBM = -40.0
+    wl_a = np.asarray(wl_a, dtype=float)
+    wl_b = np.asarray(wl_b, dtype=float)
+    power_a_dbm = np.asarray(power_a_dbm, dtype=float)
+    power_b_dbm = np.asarray(power_b_dbm, dtype=float)
+    mixes = (power_a_dbm >= MIN_POWER_DBM) & (power_b_dbm >= MIN_POWER_DBM)
+
+    # SFG output (only meaningful where both inputs have power)
+    wl_sfg = np.round(1.0 / (1.0 / wl_a + 1.0 / wl_b), 1)
+    # (geometric mean in dB, as in sfg_mixer)
+    sfg_fraction_db, pass_fraction_db = _sfg_fractions_db(conversion_efficiency)
+    p_sfg_dbm = np.maximum(
+        sfg_fraction_db + 0.5 * (power_a_dbm + power_b_dbm),
+        _SFG_FLOOR_DBM,
+    ) - insertion_loss_db
+
+    # Passthrough: unconverted fraction where mixing happens, then insertion loss
+    pass_a_dbm = np.where(mixes, power_a_dbm + pass_fraction_db, power_a_dbm) - insertion_loss_db
+    pass_b_dbm = np.where(mixes, power_b_dbm + pass_fraction_db, power_b_dbm) - insertion_loss_db
+
+    return (
+        np.where(mixes, wl_sfg, np.nan),
+        np.where(mixes, p_sfg_dbm, np.nan),
+        pass_a_dbm,
+        pass_b_dbm,
+    )
+
+
 # =============================================================================
 # Component: AWG Demultiplexer (5-channel)
 # =============================================================================
@@ -234,6 +373,11 @@ AWG_CHANNELS = {
     4: 710.0,   # (R+G) → 0
     5: 775.0,   # DET_-2 (R+R) → +1
 }
+_AWG_INDICES = tuple(AWG_CHANNELS)
+_AWG_CENTERS = np.array([AWG_CHANNELS[ch] for ch in _AWG_INDICES])
+
+# Decoded trit per AWG channel index (SFG_RESULT of the channel center)
+AWG_CHANNEL_TRIT = tuple(SFG_RESULT.get(AWG_CHANNELS[ch], 0) for ch in range(len(AWG_CHANNELS)))
 
 def awg_demux(
     signal: OpticalSignal,
@@ -253,22 +397,40 @@ def awg_demux(
     Returns:
         Dict of {channel_index: power_dbm} for each detector
     """
-    results = {}
-    sigma_nm = channel_bandwidth_nm / 2.355  # FWHM to Gaussian sigma
+    power = awg_demux_batch(
+        signal.wavelength_nm, signal.power_dbm,
+        insertion_loss_db, channel_bandwidth_nm, crosstalk_db,
+    )
+    return dict(zip(_AWG_INDICES, power.tolist()))
 
-    for ch_idx, center_wl in AWG_CHANNELS.items():
-        detuning = signal.wavelength_nm - center_wl
-        # Gaussian passband
-        passband = np.exp(-0.5 * (detuning / sigma_nm) ** 2)
 
-        if passband > 0.01:  # > 1% coupling
-            power = signal.power_dbm - insertion_loss_db + 10 * np.log10(passband)
-        else:
-            power = signal.power_dbm + crosstalk_db - insertion_loss_db
+def awg_demux_batch(
+    wavelength_nm: np.ndarray,
+    power_dbm: np.ndarray,
+    insertion_loss_db: float = 3.0,
+    channel_bandwidth_nm: float = 15.0,
+    crosstalk_db: float = -25.0,
+) -> np.ndarray:
+    """
+    Vectorized awg_demux over arrays of signals.
+
+    Returns:
+        Array of shape (*wavelength_nm.shape, n_channels) with the power
+        (dBm) at each detector, channels in AWG_CHANNELS order
+    """
+    wavelength_nm = np.asarray(wavelength_nm, dtype=float)[..., None]
+    power_dbm = np.asarray(power_dbm, dtype=float)[..., None]
+    sigma_nm = channel_bandwidth_nm / 2.355  # FWHM to Gaussian sigma
 
-        results[ch_idx] = power
+    detuning = wavelength_nm - _AWG_CENTERS
+    passband = np.exp(-0.5 * (detuning / sigma_nm) ** 2)
 
-    return results
+    in_band = passband > 0.01  # > 1% coupling
+    return np.where(
+        in_band,
+        power_dbm - insertion_loss_db + 10 * np.log10(np.where(in_band, passband, 1.0)),
+        power_dbm + crosstalk_db - insertion_loss_db,
+    )
 
 
 # =============================================================================
@@ -291,12 +453,28 @@ def photodetector(
     Returns:
         Photocurrent in μA
     """
-    power_w = 10 ** ((power_dbm - 30) / 10)  # dBm to Watts
+    power_w = math.exp((power_dbm - 30) * _LN10_OVER_10)  # dBm to Watts
     photocurrent_a = responsivity_a_per_w * power_w
     photocurrent_ua = photocurrent_a * 1e6 + dark_current_na / 1000
     return photocurrent_ua
 
 
+def photodetector_batch(
+    power_dbm: np.ndarray,
+    responsivity_a_per_w: float = 0.5,
+    dark_current_na: float = 5.0,
+) -> np.ndarray:
+    """
+    Vectorized photodetector over an array of optical powers.
+
+    Returns:
+        Photocurrent in μA, same shape as power_dbm
+    """
+    power_w = np.exp((np.asarray(power_dbm, dtype=float) - 30) * _LN10_OVER_10)  # dBm to Watts
+    photocurrent_a = responsivity_a_per_w * power_w
+    return photocurrent_a * 1e6 + dark_current_na / 1000
+
+
 # =============================================================================
 # Component: MZI Encoder
 # =============================================================================
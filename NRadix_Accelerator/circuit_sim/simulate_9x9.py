@@ -22,14 +22,15 @@ import sys
 import os
 import numpy as np
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 # Add parent to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from models.components import (
-    OpticalSignal, waveguide_transfer, sfg_mixer, awg_demux,
-    photodetector, mzi_encode,
-    TRIT_TO_WL, SFG_TABLE, SFG_RESULT, AWG_CHANNELS,
+    OpticalSignal, waveguide_transfer, sfg_mixer, sfg_mixer_batch, awg_demux_batch,
+    photodetector_batch, mzi_encode,
+    TRIT_TO_WL, WL_TO_TRIT, SFG_TABLE, SFG_RESULT, AWG_CHANNELS, AWG_CHANNEL_TRIT,
 )
 
 # Override — import constants directly
@@ -44,6 +45,15 @@ EDGE_COUPLING_LOSS = 1.0  # dB per facet
 DETECTOR_SENSITIVITY = -30.0  # dBm
 DETECTOR_THRESHOLD_UA = 0.5   # μA — above this = "detected"
 
+# Propagation loss from the array to the AWG decoder (same as
+# waveguide_transfer over ROUTING_GAP + 30% of the output IOC)
+OUTPUT_ROUTE_LOSS_DB = WG_LOSS_DB_CM * (ROUTING_GAP + IOC_OUTPUT_WIDTH * 0.3) / 1e4
+
+# Activation path: IOC encoder + routing gap into the array, then the
+# inter-PE waveguide between neighbouring columns
+ACT_INPUT_LOSS_DB = WG_LOSS_DB_CM * (IOC_INPUT_WIDTH + ROUTING_GAP) / 1e4
+ACT_HOP_LOSS_DB = WG_LOSS_DB_CM * (PE_PITCH - PE_WIDTH) / 1e4
+
 
 # =============================================================================
 # IOC Domain Interpretation Layer
@@ -113,7 +123,7 @@ class IOCInterpreter:
 # Processing Element simulation
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class PEResult:
     """Result of simulating one Processing Element."""
     row: int
@@ -127,6 +137,19 @@ class PEResult:
     pass_v_power_dbm: float  # Passthrough vertical
 
 
+# AWG_CHANNEL_TRIT as an array, for decoding many channel indices at once
+_AWG_CHANNEL_TRIT_ARR = np.array(AWG_CHANNEL_TRIT)
+
+
+# Ternary product of two trits, indexed by (trit_a + 1, trit_b + 1)
+_TRIT_PRODUCT = np.array([[+1, 0, -1], [0, 0, 0], [-1, 0, +1]], dtype=np.int8)
+
+
+def _wl_to_trit(wavelength_nm: float) -> int:
+    """Trit encoded by an input wavelength (0 if it is not a trit wavelength)."""
+    return WL_TO_TRIT.get(round(wavelength_nm), 0)
+
+
 def simulate_pe(
     activation: OpticalSignal,
     weight: OpticalSignal,
@@ -151,8 +174,8 @@ def simulate_pe(
     )
 
     # Determine expected ternary product
-    act_trit = {1550: -1, 1310: 0, 1064: +1}.get(round(activation.wavelength_nm), 0)
-    wt_trit = {1550: -1, 1310: 0, 1064: +1}.get(round(weight.wavelength_nm), 0)
+    act_trit = _wl_to_trit(activation.wavelength_nm)
+    wt_trit = _wl_to_trit(weight.wavelength_nm)
     expected = act_trit * wt_trit
 
     result = PEResult(
@@ -173,17 +196,184 @@ def simulate_pe(
 # Full 9x9 Array simulation
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ArrayResult:
     """Result of simulating the full 9x9 array."""
     input_trits: list[int]
     weight_matrix: list[list[int]]
     expected_output: list[int]
-    pe_results: list[list[PEResult]] = field(default_factory=list)
-    column_sfg_products: list[list[OpticalSignal]] = field(default_factory=list)
     detected_output: list[int] = field(default_factory=list)
-    detector_currents: list[dict] = field(default_factory=list)
+    # Detector currents (μA) of each column's dominant product as a
+    # (column, AWG channel) array; NaN rows for columns without products
+    detector_current_grid: np.ndarray = field(
+        default_factory=lambda: np.full((9, len(AWG_CHANNELS)), np.nan)
+    )
     all_correct: bool = False
+    # Per-PE SFG output as (row, col) arrays; NaN where the PE produced none
+    sfg_wl: np.ndarray = field(default_factory=lambda: np.full((9, 9), np.nan))
+    sfg_pwr: np.ndarray = field(default_factory=lambda: np.full((9, 9), np.nan))
+    product_trit: np.ndarray = field(default_factory=lambda: np.zeros((9, 9), dtype=int))
+    # Per-PE passthrough powers (horizontal / vertical)
+    pass_h_pwr: np.ndarray = field(default_factory=lambda: np.full((9, 9), np.nan))
+    pass_v_pwr: np.ndarray = field(default_factory=lambda: np.full((9, 9), np.nan))
+    # PEResult view of the grid arrays, built on first access
+    _pe_view: np.ndarray | None = field(default=None, init=False, repr=False, compare=False)
+    # Per-column dict view of detector_current_grid, built on first access
+    _currents_view: list[dict[int, float]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def pe_results(self) -> np.ndarray:
+        """
+        Per-PE view of the grid arrays: (9, 9) object array of PEResult.
+
+        Built once, on first access, and shared by later reads. Prefer the
+        grid arrays (sfg_wl, sfg_pwr, product_trit, ...) in hot code.
+        """
+        if self._pe_view is not None:
+            return self._pe_view
+        sfg_wl = self.sfg_wl.tolist()
+        sfg_pwr = self.sfg_pwr.tolist()
+        products = self.product_trit.tolist()
+        pass_h = self.pass_h_pwr.tolist()
+        pass_v = self.pass_v_pwr.tolist()
+        pe_results = np.empty((9, 9), dtype=object)
+        for row in range(9):
+            for col in range(9):
+                pe_results[row, col] = PEResult(
+                    row=row, col=col,
+                    activation_trit=self.input_trits[row],
+                    weight_trit=self.weight_matrix[row][col],
+                    expected_product=products[row][col],
+                    sfg_wavelength_nm=None if np.isnan(sfg_wl[row][col]) else sfg_wl[row][col],
+                    sfg_power_dbm=None if np.isnan(sfg_pwr[row][col]) else sfg_pwr[row][col],
+                    pass_h_power_dbm=pass_h[row][col],
+                    pass_v_power_dbm=pass_v[row][col],
+                )
+        self._pe_view = pe_results
+        return pe_results
+
+    def get_currents_dict(self, col: int) -> dict[int, float]:
+        """Detector currents of one column as {AWG channel: μA} ({} if it had no products)."""
+        currents = self.detector_current_grid[col]
+        if np.isnan(currents).all():
+            return {}
+        return dict(zip(AWG_CHANNELS, currents.tolist()))
+
+    @property
+    def detector_currents(self) -> list[dict[int, float]]:
+        """
+        Detector currents per column as {AWG channel: μA} ({} for a column
+        without products). Built once from detector_current_grid.
+        """
+        if self._currents_view is None:
+            self._currents_view = [self.get_currents_dict(col) for col in range(9)]
+        return self._currents_view
+
+    @property
+    def column_sfg_products(self) -> list[list[OpticalSignal]]:
+        """SFG product signals reaching each column's decoder, top to bottom."""
+        mixed = ~np.isnan(self.sfg_wl)
+        return [
+            [
+                OpticalSignal(wl, pwr, 0.0)
+                for wl, pwr in zip(self.sfg_wl[mixed[:, col], col].tolist(),
+                                   self.sfg_pwr[mixed[:, col], col].tolist())
+            ]
+            for col in range(9)
+        ]
+
+
+@lru_cache(maxsize=16)
+def _encoding_table(laser_power_dbm: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    The three MZI-encoded signals at one laser power, shared by every
+    activation and weight (a trit only ever encodes one of three ways).
+
+    Returns:
+        (wavelength_nm, power_dbm) arrays indexed by trit + 1 (read-only,
+        since the result is cached)
+    """
+    encoded = [mzi_encode(t, laser_power_dbm) for t in (-1, 0, 1)]
+    enc_wl = np.array([sig.wavelength_nm for sig in encoded])
+    enc_dbm = np.array([sig.power_dbm for sig in encoded])
+    enc_wl.flags.writeable = False
+    enc_dbm.flags.writeable = False
+    return enc_wl, enc_dbm
+
+
+@lru_cache(maxsize=8)
+def _weight_path_loss_db(n_rows: int) -> np.ndarray:
+    """
+    Weight path loss per row: bus → drop line → PE (40μm bus overhead).
+
+    Returns:
+        (n_rows,) array in dB (read-only, since the result is cached)
+    """
+    loss_db = WG_LOSS_DB_CM * (np.arange(n_rows) * PE_PITCH + 40) / 1e4
+    loss_db.flags.writeable = False
+    return loss_db
+
+
+def _simulate_array_9x9_core(
+    x: np.ndarray,
+    w: np.ndarray,
+    laser_power_dbm: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Optical propagation through the array (Stages 1-3) on plain arrays.
+
+    The geometry is the 9x9 chip's, but the array size follows the inputs,
+    so larger N x N configurations run through the same kernel.
+
+    Args:
+        x: Input trits, shape (N,)
+        w: Weight trits W[row][col], shape (N, N)
+        laser_power_dbm: Laser power per channel
+
+    Returns:
+        (act_wl, act_dbm, sfg_wl, sfg_dbm, pass_h_dbm, pass_v_dbm)
+        act_* are the activations entering column 0, shape (N,); the rest
+        are per-PE (row, col) arrays, with sfg_* NaN where no SFG product
+    """
+    n = x.shape[0]
+    enc_wl, enc_dbm = _encoding_table(laser_power_dbm)
+
+    # Activation signals (one per row): IOC encoder + routing gap, then the
+    # input facet's edge coupling loss
+    act_wl = enc_wl[x + 1]
+    act_in_dbm = enc_dbm[x + 1] - ACT_INPUT_LOSS_DB - EDGE_COUPLING_LOSS
+
+    # Weight signals: W[row][col] enters PE[row][col] from weight bus, with
+    # a path loss that varies by row position
+    wt_wl = enc_wl[w + 1]
+    wt_dbm = enc_dbm[w + 1] - _weight_path_loss_db(n)[:, None]
+
+    # Rows are independent (activation only flows left-to-right within its
+    # row), so the array is swept column by column with all rows mixed in
+    # one sfg_mixer_batch call.
+    sfg_wl = np.empty((n, n))
+    sfg_dbm = np.empty((n, n))
+    pass_h_dbm = np.empty((n, n))
+    pass_v_dbm = np.empty((n, n))
+
+    act_dbm = act_in_dbm
+    for col in range(n):
+        sfg_wl[:, col], sfg_dbm[:, col], pass_h_dbm[:, col], pass_v_dbm[:, col] = sfg_mixer_batch(
+            act_wl, act_dbm, wt_wl[:, col], wt_dbm[:, col],
+            ppln_length_um=PPLN_LENGTH,
+            conversion_efficiency=0.10,
+            insertion_loss_db=1.0,
+        )
+        act_dbm = pass_h_dbm[:, col]
+
+        # Propagate activation through inter-PE waveguide (to next column;
+        # phase is not tracked per PE)
+        if col < n - 1:
+            act_dbm = act_dbm - ACT_HOP_LOSS_DB
+
+    return act_wl, act_in_dbm, sfg_wl, sfg_dbm, pass_h_dbm, pass_v_dbm
 
 
 def simulate_array_9x9(
@@ -219,6 +409,8 @@ def simulate_array_9x9(
     assert len(input_trits) == 9, "Input must be length 9"
     assert len(weight_matrix) == 9 and all(len(r) == 9 for r in weight_matrix), \
         "Weight matrix must be 9x9"
+    assert all(t in TRIT_TO_WL for t in input_trits) and \
+        all(w in TRIT_TO_WL for r in weight_matrix for w in r), "Trits must be -1, 0 or +1"
 
     result = ArrayResult(
         input_trits=input_trits,
@@ -226,10 +418,13 @@ def simulate_array_9x9(
         expected_output=[],
     )
 
-    # Calculate expected output: y = W × x (standard ternary arithmetic)
-    for col in range(9):
-        acc = sum(input_trits[row] * weight_matrix[row][col] for row in range(9))
-        result.expected_output.append(acc)
+    # Expected output: y = W × x (standard ternary arithmetic), and the
+    # ternary product at every PE
+    x_np = np.asarray(input_trits, dtype=np.int8)
+    w_np = np.asarray(weight_matrix, dtype=np.int8)
+    expected = x_np.astype(int) @ w_np
+    result.expected_output = expected.tolist()
+    pe_products = _TRIT_PRODUCT[x_np[:, None] + 1, w_np + 1]
 
     if verbose:
         print("\n" + "=" * 70)
@@ -237,29 +432,25 @@ def simulate_array_9x9(
         print("=" * 70)
         print(f"\n  Input vector x = {input_trits}")
         print(f"  Weight matrix W:")
-        for row in range(9):
-            print(f"    [{', '.join(f'{w:+d}' for w in weight_matrix[row])}]")
+        sys.stdout.write("".join(
+            f"    [{', '.join(f'{w:+d}' for w in row_weights)}]\n" for row_weights in weight_matrix
+        ))
         print(f"  Expected output y = W×x = {result.expected_output}")
 
+    act_wl, act_dbm, sfg_wl, sfg_dbm, pass_h_dbm, pass_v_dbm = _simulate_array_9x9_core(
+        x_np, w_np, laser_power_dbm
+    )
+
     # =========================================================================
     # Stage 1: Encode inputs (IOC left edge)
     # =========================================================================
 
     if verbose:
         print("\n--- Stage 1: Encoding inputs ---")
-
-    # Encode activation signals (one per row)
-    activation_signals = []
-    for row in range(9):
-        sig = mzi_encode(input_trits[row], laser_power_dbm)
-        # Propagate through IOC encoder + routing gap
-        sig = waveguide_transfer(sig, IOC_INPUT_WIDTH + ROUTING_GAP, WG_LOSS_DB_CM)
-        # Add edge coupling loss (input facet)
-        sig = sig.attenuate(EDGE_COUPLING_LOSS)
-        activation_signals.append(sig)
-        if verbose:
-            print(f"  Row {row}: trit={input_trits[row]:+d} → "
-                  f"λ={sig.wavelength_nm}nm, P={sig.power_dbm:.1f} dBm")
+        sys.stdout.write("".join(
+            f"  Row {row}: trit={input_trits[row]:+d} → λ={wl}nm, P={pwr:.1f} dBm\n"
+            for row, (wl, pwr) in enumerate(zip(act_wl.tolist(), act_dbm.tolist()))
+        ))
 
     # =========================================================================
     # Stage 2: Encode weights (streaming from top)
@@ -268,19 +459,6 @@ def simulate_array_9x9(
     if verbose:
         print("\n--- Stage 2: Encoding weights ---")
 
-    # Weight signals: W[row][col] enters PE[row][col] from weight bus
-    weight_signals = []
-    for row in range(9):
-        row_weights = []
-        for col in range(9):
-            w = weight_matrix[row][col]
-            sig = mzi_encode(w, laser_power_dbm)
-            # Weight path: bus → drop line → PE (varies by row position)
-            weight_path_um = row * PE_PITCH + 40  # 40μm bus overhead
-            sig = waveguide_transfer(sig, weight_path_um, WG_LOSS_DB_CM)
-            row_weights.append(sig)
-        weight_signals.append(row_weights)
-
     # =========================================================================
     # Stage 3: Propagate through 9x9 PE array
     # =========================================================================
@@ -288,40 +466,22 @@ def simulate_array_9x9(
     if verbose:
         print("\n--- Stage 3: PE array computation ---")
 
-    # Track SFG products per column for accumulation
-    column_products = [[] for _ in range(9)]  # column_products[col] = list of SFG signals
-
-    # Track PE results
-    pe_results = [[None]*9 for _ in range(9)]
-
-    # Process array: activation flows left-to-right through each row,
-    # weights are injected per-PE, SFG products collected per column
-    for row in range(9):
-        act = activation_signals[row]
-
-        for col in range(9):
-            wt = weight_signals[row][col]
-
-            # Simulate this PE
-            sfg_out, act, pass_v, pe_res = simulate_pe(act, wt, row, col)
-            pe_results[row][col] = pe_res
-
-            # Propagate activation through inter-PE waveguide (to next column)
-            if col < 8:
-                act = waveguide_transfer(act, PE_PITCH - PE_WIDTH, WG_LOSS_DB_CM)
-
-            # Collect SFG product for this column
-            if sfg_out is not None:
-                column_products[col].append(sfg_out)
-
-            if verbose and sfg_out is not None:
-                print(f"  PE[{row},{col}]: {pe_res.activation_trit:+d} × "
-                      f"{pe_res.weight_trit:+d} = {pe_res.expected_product:+d} → "
-                      f"SFG λ={sfg_out.wavelength_nm:.1f}nm, "
-                      f"P={sfg_out.power_dbm:.1f} dBm")
+    result.sfg_wl = sfg_wl
+    result.sfg_pwr = sfg_dbm
+    result.product_trit = pe_products.astype(int)
+    result.pass_h_pwr = pass_h_dbm
+    result.pass_v_pwr = pass_v_dbm
 
-    result.pe_results = pe_results
-    result.column_sfg_products = column_products
+    # Per-PE PEResult / OpticalSignal objects are only built on access
+    # (ArrayResult.pe_results, ArrayResult.column_sfg_products)
+    if verbose:
+        sys.stdout.write("".join(
+            f"  PE[{row},{col}]: {input_trits[row]:+d} × "
+            f"{weight_matrix[row][col]:+d} = {int(pe_products[row, col]):+d} → "
+            f"SFG λ={sfg_wl[row, col]:.1f}nm, "
+            f"P={sfg_dbm[row, col]:.1f} dBm\n"
+            for row, col in np.argwhere(~np.isnan(sfg_wl)).tolist()
+        ))
 
     # =========================================================================
     # Stage 4: Column output → AWG decode → photodetectors
@@ -330,71 +490,58 @@ def simulate_array_9x9(
     if verbose:
         print("\n--- Stage 4: Decoding outputs ---")
 
-    for col in range(9):
-        products = column_products[col]
-
-        if not products:
-            # No SFG products in this column (all weights or inputs were 0)
-            result.detected_output.append(0)
-            result.detector_currents.append({})
-            if verbose:
-                print(f"  Column {col}: No SFG products → output = 0")
-            continue
-
-        # Accumulate: determine the net ternary result from all SFG products
-        # Each product's wavelength encodes the multiplication result
-        # We need to sum the ternary products
-        net_trit_sum = 0
-        product_details = []
-
-        for sfg in products:
-            # Route through output waveguide to decoder
-            sfg_routed = waveguide_transfer(
-                sfg,
-                ROUTING_GAP + IOC_OUTPUT_WIDTH * 0.3,  # to AWG input
-                WG_LOSS_DB_CM,
-            )
-
-            # AWG demux
-            channel_powers = awg_demux(sfg_routed)
+    # Route every product to the decoder (the AWG only sees the power, so
+    # the routing phase is not tracked). Each product decodes to its
+    # strongest channel (ties -> lower channel).
+    mixed = ~np.isnan(result.sfg_wl)
+    routed_dbm = result.sfg_pwr - OUTPUT_ROUTE_LOSS_DB
+
+    # The strongest channel depends only on the product's wavelength (power
+    # shifts every channel equally), and a product with a zero trit always
+    # lands on a 0 channel. Those PEs add nothing to the column sum, so only
+    # the nonzero PEs are demuxed (all products when tracing).
+    decode = mixed if verbose else mixed & (pe_products != 0)
+    best_ch = np.zeros((9, 9), dtype=int)
+    best_ch[decode] = awg_demux_batch(result.sfg_wl[decode], routed_dbm[decode]).argmax(axis=-1)
+    trit_values = np.where(decode, _AWG_CHANNEL_TRIT_ARR[best_ch], 0)
+
+    # Accumulate: the column output is the sum of its products' trits
+    # (0 for a column without products)
+    column_sums = trit_values.sum(axis=0)
+    result.detected_output = column_sums.tolist()
+
+    # Detector currents for the dominant product of each column (first row
+    # on ties)
+    strongest = np.where(mixed, routed_dbm, -np.inf).argmax(axis=0)
+    cols = np.arange(9)
+    det_currents = photodetector_batch(awg_demux_batch(
+        result.sfg_wl[strongest, cols], routed_dbm[strongest, cols]
+    ))
+    det_currents[~mixed.any(axis=0)] = np.nan
+    result.detector_current_grid = det_currents
 
-            # Find which channel has highest power
-            best_ch = max(channel_powers, key=channel_powers.get)
-            best_power = channel_powers[best_ch]
-            best_wl = AWG_CHANNELS[best_ch]
-
-            # Decode wavelength to trit result
-            trit_value = SFG_RESULT.get(best_wl, 0)
-            net_trit_sum += trit_value
-
-            product_details.append((best_wl, trit_value, best_power))
-
-        result.detected_output.append(net_trit_sum)
-
-        # Compute detector currents for the dominant signal
-        det_currents = {}
-        if products:
-            strongest = max(products, key=lambda s: s.power_dbm)
-            strongest_routed = waveguide_transfer(
-                strongest, ROUTING_GAP + IOC_OUTPUT_WIDTH * 0.3, WG_LOSS_DB_CM,
-            )
-            ch_powers = awg_demux(strongest_routed)
-            for ch, pwr in ch_powers.items():
-                det_currents[ch] = photodetector(pwr)
-        result.detector_currents.append(det_currents)
-
-        if verbose:
+    if verbose:
+        n_products = mixed.sum(axis=0).tolist()
+        column_lines = []
+        for col in range(9):
+            if not n_products[col]:
+                # No SFG products in this column (all weights or inputs were 0)
+                column_lines.append(f"  Column {col}: No SFG products → output = 0\n")
+                continue
+            rows = mixed[:, col]
             detail_str = ", ".join(
-                f"λ={wl:.1f}nm(={tv:+d})" for wl, tv, _ in product_details
+                f"λ={AWG_CHANNELS[ch]:.1f}nm(={tv:+d})"
+                for ch, tv in zip(best_ch[rows, col].tolist(), trit_values[rows, col].tolist())
             )
-            print(f"  Column {col}: {len(products)} products [{detail_str}] "
-                  f"→ sum = {net_trit_sum:+d}")
+            column_lines.append(f"  Column {col}: {n_products[col]} products [{detail_str}] "
+                                f"→ sum = {result.detected_output[col]:+d}\n")
+        sys.stdout.write("".join(column_lines))
 
     # =========================================================================
     # Stage 5: Verify
     # =========================================================================
 
-    result.all_correct = (result.detected_output == result.expected_output)
+    result.all_correct = bool(np.array_equal(column_sums, expected))
 
     if verbose:
         print("\n" + "=" * 70)
@@ -406,14 +553,13 @@ def simulate_array_9x9(
         print(f"  Match:    {match}")
 
         # Power budget summary
-        if result.pe_results[0][0]:
-            pe00 = result.pe_results[0][0]
-            if pe00.sfg_power_dbm is not None:
-                print(f"\n  Power budget (PE[0,0]):")
-                print(f"    SFG output: {pe00.sfg_power_dbm:.1f} dBm")
-                print(f"    Detector sensitivity: {DETECTOR_SENSITIVITY} dBm")
-                margin = pe00.sfg_power_dbm - DETECTOR_SENSITIVITY
-                print(f"    Margin: {margin:.1f} dB")
+        pe00_sfg_dbm = float(result.sfg_pwr[0, 0])
+        if not np.isnan(pe00_sfg_dbm):
+            print(f"\n  Power budget (PE[0,0]):")
+            print(f"    SFG output: {pe00_sfg_dbm:.1f} dBm")
+            print(f"    Detector sensitivity: {DETECTOR_SENSITIVITY} dBm")
+            margin = pe00_sfg_dbm - DETECTOR_SENSITIVITY
+            print(f"    Margin: {margin:.1f} dB")
 
     return result
 
@@ -600,12 +746,9 @@ def test_ioc_domain_modes():
     print(f"\n  VERIFICATION: Physical signals unchanged between modes")
     result2 = simulate_array_9x9(x, W, laser_power_dbm=10.0, verbose=False)
     signals_match = (result.detected_output == result2.detected_output)
-    if result.pe_results[0][0] and result2.pe_results[0][0]:
-        sfg_match = (result.pe_results[0][0].sfg_wavelength_nm ==
-                     result2.pe_results[0][0].sfg_wavelength_nm)
-        power_match = (result.pe_results[0][0].sfg_power_dbm ==
-                       result2.pe_results[0][0].sfg_power_dbm)
-        signals_match = signals_match and sfg_match and power_match
+    sfg_match = (result.sfg_wl[0, 0] == result2.sfg_wl[0, 0])
+    power_match = (result.sfg_pwr[0, 0] == result2.sfg_pwr[0, 0])
+    signals_match = signals_match and sfg_match and power_match
 
     print(f"    Outputs identical: {signals_match}")
     print(f"    Proof: the glass doesn't change. Only the IOC's mind changes.")
@@ -0,0 +1,47 @@
+"""
+Tests for the photonic component models.
+"""
+
+import math
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.components import OpticalSignal, sfg_mixer, sfg_mixer_batch
+
+
+class TestSFGMixerEfficiencyEdges:
+    """sfg_mixer / sfg_mixer_batch at the ends of the 0.0-1.0 efficiency range."""
+
+    @pytest.fixture
+    def signals(self):
+        return OpticalSignal(1550.0, 10.0), OpticalSignal(1310.0, 10.0)
+
+    def test_zero_efficiency_floors_sfg(self, signals):
+        sfg, pass_a, pass_b = sfg_mixer(*signals, conversion_efficiency=0.0)
+        assert sfg.power_dbm == pytest.approx(-101.0)
+        assert pass_a.power_dbm == pytest.approx(9.0)
+        assert pass_b.power_dbm == pytest.approx(9.0)
+
+    def test_full_efficiency_empties_passthrough(self, signals):
+        sfg, pass_a, pass_b = sfg_mixer(*signals, conversion_efficiency=1.0)
+        assert sfg.power_dbm == pytest.approx(9.0)
+        assert pass_a.power_dbm == -math.inf
+        assert pass_b.power_dbm == -math.inf
+
+    @pytest.mark.parametrize("efficiency", [0.0, 1.0])
+    def test_batch_matches_scalar(self, signals, efficiency):
+        a, b = signals
+        sfg, pass_a, pass_b = sfg_mixer(a, b, conversion_efficiency=efficiency)
+        _, sfg_pwr, pass_a_dbm, pass_b_dbm = sfg_mixer_batch(
+            np.array([a.wavelength_nm]), np.array([a.power_dbm]),
+            np.array([b.wavelength_nm]), np.array([b.power_dbm]),
+            conversion_efficiency=efficiency,
+        )
+        assert sfg_pwr[0] == sfg.power_dbm
+        assert pass_a_dbm[0] == pass_a.power_dbm
+        assert pass_b_dbm[0] == pass_b.power_dbm
@@ -120,6 +120,10 @@ def trits_to_float(trits: List[int]) -> float:
     return value / max_val if max_val > 0 else 0.0
 
 
+# Base-3 place values of the 5 trits packed into one byte
+_TRIT_PACK_WEIGHTS = np.array([81, 27, 9, 3, 1], dtype=np.int64)
+
+
 def pack_trits(trits: List[int]) -> bytes:
     """
     Pack a list of trits into a compact byte representation.
@@ -138,24 +142,20 @@ def pack_trits(trits: List[int]) -> bytes:
         >>> pack_trits([1, 0, -1, 1, 0])
         b'\\x87'
     """
-    # Pad to multiple of 5
-    padded = trits.copy()
-    while len(padded) % 5 != 0:
-        padded.append(0)
-
-    result = bytearray()
+    # Convert trits from [-1, 0, 1] to [0, 1, 2] in a buffer padded to a
+    # multiple of 5 with zero trits
+    num_trits = len(trits)
+    encoded = np.ones(num_trits + (-num_trits % 5), dtype=np.int64)
+    encoded[:num_trits] += np.asarray(trits, dtype=np.int64)
 
-    for i in range(0, len(padded), 5):
-        chunk = padded[i:i+5]
-        # Convert trits from [-1, 0, 1] to [0, 1, 2]
-        encoded = [(t + 1) for t in chunk]
-        # Pack as base-3 number
-        packed = encoded[0] * 81 + encoded[1] * 27 + encoded[2] * 9 + encoded[3] * 3 + encoded[4]
-        result.append(packed)
+    # Pack each 5-trit chunk as a base-3 number
+    packed = encoded.reshape(-1, 5) @ _TRIT_PACK_WEIGHTS
+    if packed.size and (packed.min() < 0 or packed.max() > 255):
+        raise ValueError("bytes must be in range(0, 256)")
 
     # Prepend the original length for unpacking
-    length_bytes = struct.pack('>H', len(trits))
-    return bytes(length_bytes + result)
+    length_bytes = struct.pack('>H', num_trits)
+    return length_bytes + packed.astype(np.uint8).tobytes()
 
 
 def unpack_trits(data: bytes) -> List[int]:
@@ -177,23 +177,75 @@ def unpack_trits(data: bytes) -> List[int]:
 
     # Extract original length
     original_length = struct.unpack('>H', data[:2])[0]
-    packed_data = data[2:]
-
-    trits = []
+    packed_data = np.frombuffer(data, dtype=np.uint8, offset=2)
 
-    for byte in packed_data:
-        # Unpack base-3 number to 5 trits
-        chunk = []
-        remaining = byte
-        for _ in range(5):
-            chunk.append(remaining % 3)
-            remaining //= 3
-        chunk.reverse()
-        # Convert from [0, 1, 2] back to [-1, 0, 1]
-        trits.extend([t - 1 for t in chunk])
+    # Unpack each base-3 byte to 5 trits (most significant first) and
+    # convert from [0, 1, 2] back to [-1, 0, 1]
+    trits = (packed_data[:, None] // _TRIT_PACK_WEIGHTS) % 3 - 1
 
     # Trim to original length
-    return trits[:original_length]
+    return trits.ravel()[:original_length].tolist()
+
+
+# =============================================================================
+# Simulator Kernels
+# =============================================================================
+
+def _quantize_inplace(values: np.ndarray, max_level: float) -> np.ndarray:
+    """
+    Round values onto the balanced ternary grid in place.
+
+    Same result as a float_to_trits -> trits_to_float roundtrip: the levels
+    are uniform, so the roundtrip is clamping to [-1, 1] and rounding onto
+    the integer grid [-max_level, max_level]. Non-float64 arrays are rounded
+    through a float64 copy so every dtype quantizes the same way.
+    """
+    if values.dtype != np.float64:
+        values[...] = _quantize_inplace(values.astype(np.float64), max_level)
+        return values
+
+    np.clip(values, -1.0, 1.0, out=values)
+    values *= max_level
+    np.rint(values, out=values)
+    values /= max_level
+    return values
+
+
+def _fused_compute(
+    inputs: np.ndarray,
+    weights: np.ndarray,
+    weight_scale: float,
+    max_level: float,
+) -> np.ndarray:
+    """
+    Simulated optical matrix multiply of a (batch, n) input block.
+
+    Normalize -> quantize -> matmul -> rescale -> ADC quantize, run in place
+    on two buffers (the normalized inputs and the matmul result) rather
+    than allocating a new array at every step.
+
+    Leading dimensions stack independent arrays: inputs (T, batch, n) with
+    weights (T, n, n) and weight_scale (T, 1, 1) computes T arrays at once,
+    each with its own ADC scale.
+    """
+    # Normalize and quantize inputs
+    input_max = np.abs(inputs).max(axis=-1, keepdims=True)
+    input_max = np.where(input_max > 0, input_max, 1.0)
+    quantized_inputs = _quantize_inplace(inputs / input_max, max_level)
+
+    # Perform matrix multiplication (simulating optical computation)
+    result = quantized_inputs @ np.swapaxes(weights, -1, -2)
+
+    # Scale result back
+    result *= input_max
+    result *= weight_scale
+
+    # Quantize output (simulating ADC), one scale per array
+    result_max = np.abs(result).max(axis=(-2, -1), keepdims=True)
+    result /= result_max + 1e-10
+    _quantize_inplace(result, max_level)
+    result *= result_max
+    return result
 
 
 # =============================================================================
@@ -246,6 +298,7 @@ class NRadixSimulator:
         self.clock_freq_mhz = clock_freq_mhz
         self.weights: Optional[np.ndarray] = None
         self._num_trits = 9  # Precision for encoding
+        self._max_level = (3 ** self._num_trits - 1) / 2
         self._initialized = True
 
     def load_weights(self, weights: np.ndarray) -> None:
@@ -286,15 +339,8 @@ class NRadixSimulator:
         Returns:
             Quantized array with same shape.
         """
-        # Convert to trits and back to simulate hardware precision loss
-        flat = values.flatten()
-        quantized = np.zeros_like(flat)
-
-        for i, val in enumerate(flat):
-            trits = float_to_trits(float(val), self._num_trits)
-            quantized[i] = trits_to_float(trits)
-
-        return quantized.reshape(values.shape)
+        quantized = _quantize_inplace(np.array(values, dtype=np.float64), self._max_level)
+        return quantized.astype(values.dtype, copy=False)
 
     def compute(self, inputs: np.ndarray) -> np.ndarray:
         """
@@ -327,23 +373,7 @@ class NRadixSimulator:
         if inputs.shape[1] != self.array_size:
             raise ValueError(f"Input dimension must be {self.array_size}, got {inputs.shape[1]}")
 
-        # Normalize and quantize inputs
-        input_max = np.abs(inputs).max(axis=1, keepdims=True)
-        input_max = np.where(input_max > 0, input_max, 1.0)
-        normalized_inputs = inputs / input_max
-
-        quantized_inputs = self._quantize_to_trits(normalized_inputs)
-
-        # Perform matrix multiplication (simulating optical computation)
-        result = quantized_inputs @ self.weights.T
-
-        # Scale result back
-        result = result * input_max * self._weight_scale
-
-        # Quantize output (simulating ADC)
-        result = self._quantize_to_trits(
-            result / (np.abs(result).max() + 1e-10)
-        ) * np.abs(result).max()
+        result = _fused_compute(inputs, self.weights, self._weight_scale, self._max_level)
 
         if is_1d:
             return result.flatten()
@@ -421,7 +451,9 @@ class NRadixWDMSimulator:
 
     This models the real physics: different wavelengths don't interfere with
     each other, so 6 independent computations can happen simultaneously through
-    the same waveguides.
+    the same waveguides. The simulator mirrors this by running every triplet in
+    one stacked matmul when the weights and inputs are float64; other dtypes
+    fall back to computing the triplets one after another.
 
     Attributes:
         array_size: Size of the systolic array (27 or 81).
@@ -472,6 +504,12 @@ class NRadixWDMSimulator:
         # Store active triplet info
         self.active_triplets = [WDM_TRIPLETS[i+1] for i in range(num_triplets)]
 
+        # Triplet weights stacked for single-call compute, and the per-triplet
+        # weight arrays they were stacked from
+        self._stack_src: Optional[List[np.ndarray]] = None
+        self._weights_stack: Optional[np.ndarray] = None
+        self._scale_stack: Optional[np.ndarray] = None
+
     def load_weights(self, weights_list: List[np.ndarray]) -> None:
         """
         Load weights for all triplets.
@@ -501,8 +539,14 @@ class NRadixWDMSimulator:
         Args:
             weights: Single weight matrix to broadcast to all triplets.
         """
-        for sim in self.triplet_sims:
-            sim.load_weights(weights.copy())
+        # Quantize once; every triplet shares the same (read-only in use)
+        # weight array. load_weights never mutates its argument, so no
+        # defensive copy is needed.
+        first, *others = self.triplet_sims
+        first.load_weights(weights)
+        for sim in others:
+            sim.weights = first.weights
+            sim._weight_scale = first._weight_scale
 
     def compute(self, inputs_list: List[np.ndarray]) -> List[np.ndarray]:
         """
@@ -524,11 +568,44 @@ class NRadixWDMSimulator:
         if len(inputs_list) != self.num_triplets:
             raise ValueError(f"Expected {self.num_triplets} inputs, got {len(inputs_list)}")
 
-        results = []
-        for sim, inputs in zip(self.triplet_sims, inputs_list):
-            results.append(sim.compute(inputs))
+        # One input vector per triplet (the common case): run every triplet
+        # in a single stacked matmul
+        if self._can_stack(inputs_list):
+            weights, scales = self._stacked_weights()
+            results = _fused_compute(
+                np.stack(inputs_list)[:, None, :], weights, scales,
+                self.triplet_sims[0]._max_level,
+            )
+            return list(results[:, 0, :])
 
-        return results
+        return [sim.compute(inputs) for sim, inputs in zip(self.triplet_sims, inputs_list)]
+
+    def _can_stack(self, inputs_list: List[np.ndarray]) -> bool:
+        """Whether compute() can run all triplets as one stacked float64 matmul."""
+        return self._weights_stackable() and all(
+            isinstance(inputs, np.ndarray) and inputs.dtype == np.float64
+            and inputs.shape == (self.array_size,) for inputs in inputs_list
+        )
+
+    def _weights_stackable(self) -> bool:
+        """Whether every triplet has float64 weights loaded."""
+        return all(sim.weights is not None and sim.weights.dtype == np.float64
+                   for sim in self.triplet_sims)
+
+    def _stacked_weights(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Triplet weights as a (T, n, n) stack and weight scales as (T, 1, 1).
+
+        Rebuilt only when a triplet's weights have been reloaded.
+        """
+        current = [sim.weights for sim in self.triplet_sims]
+        if self._stack_src is None or any(a is not b for a, b in zip(self._stack_src, current)):
+            self._weights_stack = np.stack(current)
+            self._scale_stack = np.array(
+                [sim._weight_scale for sim in self.triplet_sims], dtype=np.float64
+            ).reshape(-1, 1, 1)
+            self._stack_src = current
+        return self._weights_stack, self._scale_stack
 
     def compute_broadcast(self, inputs: np.ndarray) -> List[np.ndarray]:
         """
@@ -543,7 +620,9 @@ class NRadixWDMSimulator:
         Returns:
             List of results from all triplets.
         """
-        return [sim.compute(inputs.copy()) for sim in self.triplet_sims]
+        # compute() never mutates its inputs, so every triplet can read the
+        # same array
+        return self.compute([inputs] * self.num_triplets)
 
     def compute_batch(self, batch_inputs: np.ndarray) -> np.ndarray:
         """
@@ -562,18 +641,33 @@ class NRadixWDMSimulator:
             raise ValueError("batch_inputs must be 2D (batch_size, array_size)")
 
         batch_size = batch_inputs.shape[0]
+
+        # Row i runs on triplet i % num_triplets. For float64 batches that is
+        # one stacked call: pad the batch to whole chunks of num_triplets and
+        # lay it out as (triplet, chunk, 1, n) against (triplet, 1, n, n)
+        # weights, so every row keeps its own ADC scale.
+        if (batch_size and batch_inputs.dtype == np.float64
+                and batch_inputs.shape[1] == self.array_size and self._weights_stackable()):
+            weights, scales = self._stacked_weights()
+            num_chunks = -(-batch_size // self.num_triplets)
+            padded = np.zeros((num_chunks * self.num_triplets, self.array_size))
+            padded[:batch_size] = batch_inputs
+
+            chunks = padded.reshape(num_chunks, self.num_triplets, 1, self.array_size)
+            results = _fused_compute(
+                chunks.transpose(1, 0, 2, 3), weights[:, None], scales[:, None],
+                self.triplet_sims[0]._max_level,
+            )
+            return results.transpose(1, 0, 2, 3).reshape(-1, self.array_size)[:batch_size]
+
         results = []
 
         # Process in chunks of num_triplets
         for i in range(0, batch_size, self.num_triplets):
             chunk = batch_inputs[i:i+self.num_triplets]
-            chunk_results = []
-
-            for j, inputs in enumerate(chunk):
-                if j < len(self.triplet_sims):
-                    chunk_results.append(self.triplet_sims[j].compute(inputs))
 
-            results.extend(chunk_results)
+            # Row j of the chunk runs on triplet j
+            results.extend(sim.compute(inputs) for sim, inputs in zip(self.triplet_sims, chunk))
 
         return np.array(results)
 
@@ -10,11 +10,11 @@ import numpy as np
 
 # Import from the nradix module
 try:
-    from nradix import NRadixSimulator
+    from nradix import NRadixSimulator, float_to_trits, trits_to_float
 except ImportError:
     import sys
     sys.path.insert(0, '/home/jackwayne/Desktop/Optical_computing/nradix-driver/python')
-    from nradix import NRadixSimulator
+    from nradix import NRadixSimulator, float_to_trits, trits_to_float
 
 
 class TestNRadixSimulatorInitialization:
@@ -349,5 +349,29 @@ class TestBatchCompute:
         assert outputs.shape == (batch_size, size)
 
 
+class TestQuantization:
+    """Test the simulator's ternary quantizer."""
+
+    def test_matches_trit_roundtrip(self):
+        """Test quantizing matches a float_to_trits/trits_to_float roundtrip."""
+        sim = NRadixSimulator(array_size=27)
+        values = np.concatenate([
+            np.random.uniform(-1.2, 1.2, 500),
+            np.arange(-9841, 9842) / 9841,
+            (np.arange(-20, 20) + 0.5) / 9841,  # exact ties between levels
+        ])
+
+        expected = np.array([
+            trits_to_float(float_to_trits(float(v), 9)) for v in values
+        ])
+        np.testing.assert_array_equal(sim._quantize_to_trits(values), expected)
+
+    def test_preserves_shape(self):
+        """Test quantizing keeps the input shape."""
+        sim = NRadixSimulator(array_size=27)
+        values = np.random.uniform(-1.0, 1.0, (3, 27))
+        assert sim._quantize_to_trits(values).shape == (3, 27)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])